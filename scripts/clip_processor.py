@@ -1,19 +1,69 @@
 import os
 import csv
+import argparse
+import queue
 import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from pathlib import Path
 import yt_dlp
 from typing import List, Tuple
-from urllib.parse import urlparse, parse_qs
 
+from clip_utils import (
+    RateLimitBackoff,
+    clean_youtube_url,
+    convert_timestamps,
+    evict_video_cache,
+    find_cached_video,
+    is_rate_limited,
+    log,
+    youtube_video_id,
+    youtube_ydl,
+)
 
-def download_youtube_video(url: str, output_path: str) -> str:
+
+DOWNLOAD_QUEUE_SIZE = 2  # Downloaded videos waiting to be cut; bounds temp disk usage
+CUT_BATCH_SIZE = 16  # Clips cut per ffmpeg process; each clip is a separate open input
+MAX_RETRIES = 4  # Download retries after HTTP 429
+CONCURRENT_FRAGMENTS = 8  # DASH/HLS fragments fetched in parallel per download
+REENCODE_CLIPS = False  # Default for --reencode: frame-exact cuts, re-encoding video (on the GPU when possible)
+
+_backoff = RateLimitBackoff()
+
+
+# Shared YoutubeDL instance: extractors, cookie jar and HTTP keep-alive
+# connections survive across downloads instead of being rebuilt per video
+_YDL_OPTS = {
+    'format': 'bestvideo+bestaudio/best',
+    'quiet': False,
+    'no_warnings': False,
+    'concurrent_fragment_downloads': CONCURRENT_FRAGMENTS,
+}
+_ydl = None
+_ydl_lock = threading.Lock()
+
+
+def _get_ydl() -> yt_dlp.YoutubeDL:
+    """
+    Return the shared YoutubeDL instance, creating it on first use.
+    
+    Only YouTube extractors are registered (see youtube_ydl).
+    """
+    global _ydl
+    if _ydl is None:
+        _ydl = youtube_ydl(dict(_YDL_OPTS))
+    return _ydl
+
+
+def download_youtube_video(url: str, output_path: str, name: str = '%(title)s') -> str:
     """
     Download a YouTube video from a given URL.
     
     Args:
         url (str): The YouTube video URL
         output_path (str): The directory to save the video
+        name (str): yt-dlp output template for the file name (without extension)
     
     Returns:
         str: The path to the downloaded video file
@@ -24,28 +74,37 @@ def download_youtube_video(url: str, output_path: str) -> str:
     os.makedirs(output_path, exist_ok=True)
     
     try:
-        print(f"  Downloading video from: {url}")
+        log(f"  Downloading video from: {url}")
         
-        ydl_opts = {
-            'format': 'bestvideo+bestaudio/best',
-            'outtmpl': os.path.join(output_path, '%(title)s.%(ext)s'),
-            'quiet': False,
-            'no_warnings': False,
-        }
+        outtmpl = os.path.join(output_path, f'{name}.%(ext)s')
         
-        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-            info = ydl.extract_info(url, download=True)
-            output_file = ydl.prepare_filename(info)
+        # Only pause when YouTube actually throttles us
+        for attempt in range(MAX_RETRIES + 1):
+            _backoff.wait()
+            try:
+                # The shared instance is not thread-safe; params are per call
+                with _ydl_lock:
+                    ydl = _get_ydl()
+                    ydl.params['outtmpl']['default'] = outtmpl
+                    info = ydl.extract_info(url, download=True)
+                    output_file = ydl.prepare_filename(info)
+                break
+            except yt_dlp.utils.DownloadError as e:
+                if attempt == MAX_RETRIES or not is_rate_limited(e):
+                    raise
+                log(f"  Rate limited by YouTube, retrying in {_backoff.throttled():.0f}s")
         
-        print(f"  Download completed: {output_file}")
+        _backoff.succeeded()
+        log(f"  Download completed: {output_file}")
         return output_file
         
     except Exception as e:
-        print(f"  Error downloading video: {str(e)}")
+        log(f"  Error downloading video: {str(e)}")
         raise
 
 
-def cut_clip(input_video: str, start_time: float, duration: float, output_file: str) -> None:
+def cut_clip(input_video: str, start_time: float, duration: float, output_file: str,
+             reencode: bool = REENCODE_CLIPS) -> None:
     """
     Cut a clip from a video using ffmpeg.
     
@@ -54,48 +113,162 @@ def cut_clip(input_video: str, start_time: float, duration: float, output_file:
         start_time (float): Start time in seconds
         duration (float): Duration of the clip in seconds
         output_file (str): Path to save the output clip
+        reencode (bool): Re-encode the video for a frame-exact cut instead of stream copying
     
     Raises:
         Exception: If ffmpeg fails
     """
+    os.makedirs(os.path.dirname(output_file), exist_ok=True)
+    cut_clip_fast(input_video, start_time, duration, output_file, reencode)
+
+
+def cut_clip_fast(input_video: str, start_time: float, duration: float, output_file: str,
+                  reencode: bool = REENCODE_CLIPS) -> None:
+    """
+    Same as cut_clip, but assumes the output directory already exists.
+    
+    Raises:
+        Exception: If ffmpeg fails
+    """
+    clips = [(start_time, duration, output_file)]
+    finish_cut_clips(start_cut_clips(input_video, clips, reencode), clips)
+
+
+@lru_cache(maxsize=None)
+def nvenc_available() -> bool:
+    """
+    Check once whether ffmpeg can decode with CUDA and encode with NVENC.
+    
+    Builds often list cuda/h264_nvenc even without an NVIDIA GPU, so a tiny
+    test encode is run to confirm the hardware is actually usable.
+    """
     try:
-        os.makedirs(os.path.dirname(output_file), exist_ok=True)
+        hwaccels = subprocess.run(['ffmpeg', '-hide_banner', '-hwaccels'],
+                                  capture_output=True, text=True, timeout=10)
+        if 'cuda' not in hwaccels.stdout.split():
+            return False
         
-        # Use -ss before -i for faster seeking with copy codecs
-        cmd = [
-            'ffmpeg',
+        probe = subprocess.run([
+            'ffmpeg', '-hide_banner', '-loglevel', 'error',
+            '-f', 'lavfi', '-i', 'color=size=256x256:duration=0.1',
+            '-c:v', 'h264_nvenc', '-f', 'null', '-',
+        ], capture_output=True, text=True, timeout=30)
+        return probe.returncode == 0
+    except (OSError, subprocess.TimeoutExpired):
+        return False
+
+
+def start_cut_clips(input_video: str, clips: List[Tuple[float, float, str]],
+                    reencode: bool = REENCODE_CLIPS) -> subprocess.Popen:
+    """
+    Launch one ffmpeg process that cuts several clips, without waiting for it.
+    
+    Every clip gets its own input-side -ss, so each output keeps the fast
+    keyframe seek. The file is still opened and probed once per clip; only
+    the process startup is shared. A single -i with output-side -ss would
+    open it once, but ffmpeg would then demux everything up to each start
+    time, and with stream copy the clips would begin on non-keyframes.
+    CUT_BATCH_SIZE caps how many inputs one process holds open. Output
+    directories must already exist.
+    
+    Args:
+        input_video (str): Path to the input video file
+        clips (List[Tuple[float, float, str]]): (start_time, duration, output_file) per clip
+        reencode (bool): Re-encode the video (NVENC when usable, else libx264) instead of stream copying
+    
+    Returns:
+        subprocess.Popen: The running ffmpeg process; pass it to finish_cut_clips
+    """
+    # Hardware decode only pays off when re-encoding; for stream copy it
+    # would just add a GPU<->host transfer
+    use_nvenc = reencode and nvenc_available()
+    if not reencode:
+        video_codec = ['-c:v', 'copy']         # Copy video codec without re-encoding
+    elif use_nvenc:
+        video_codec = ['-c:v', 'h264_nvenc', '-preset', 'p4']
+    else:
+        video_codec = ['-c:v', 'libx264', '-preset', 'veryfast', '-crf', '18']
+    
+    cmd = ['ffmpeg', '-hide_banner', '-loglevel', 'error', '-y']
+    for start_time, duration, _ in clips:
+        if use_nvenc:
+            cmd += ['-hwaccel', 'cuda', '-hwaccel_output_format', 'cuda']
+        cmd += [
             '-ss', str(start_time),
-            '-i', input_video,
             '-t', str(duration),
-            '-c:v', 'copy',         # Copy video codec without re-encoding
-            '-c:a', 'copy',         # Copy audio codec without re-encoding
             '-fflags', '+genpts',   # Generate presentation timestamps to fix sync issues
-            '-y',  # Overwrite output file
-            '-hide_banner',
-            '-loglevel', 'error',
-            output_file
+            '-i', input_video,
         ]
+    for input_idx, (_, _, output_file) in enumerate(clips):
+        cmd += [
+            '-map', f'{input_idx}:v:0?',
+            '-map', f'{input_idx}:a:0?',
+            *video_codec,
+            '-c:a', 'copy',         # Copy audio codec without re-encoding
+            output_file,
+        ]
+    
+    # Stream copy writes nothing useful to stdout; only stderr is kept for errors
+    return subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+
+
+def finish_cut_clips(proc: subprocess.Popen, clips: List[Tuple[float, float, str]]) -> None:
+    """
+    Wait for an ffmpeg process from start_cut_clips and verify its outputs.
+    
+    Args:
+        proc (subprocess.Popen): The running ffmpeg process
+        clips (List[Tuple[float, float, str]]): The clips it was started with
+    
+    Raises:
+        Exception: If ffmpeg fails or any output is missing
+    """
+    try:
+        try:
+            _, stderr = proc.communicate(timeout=120 * len(clips))
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.communicate()
+            raise
         
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=120)
-        
-        if result.returncode != 0:
-            print(f"    FFmpeg error details: {result.stderr[:300]}")
-            raise Exception(f"FFmpeg error")
+        if proc.returncode != 0:
+            log(f"    FFmpeg error details: {stderr[:300]}")
+            raise Exception("FFmpeg error")
         
-        # Verify the output file was created and has content
-        if os.path.exists(output_file) and os.path.getsize(output_file) > 0:
-            print(f"    Clip created: {output_file} ({os.path.getsize(output_file) / 1024:.1f} KB)")
-        else:
-            raise Exception(f"Output file was not created or is empty")
+        # Verify every output file was created and has content
+        for _, _, output_file in clips:
+            if os.path.exists(output_file) and os.path.getsize(output_file) > 0:
+                log(f"    Clip created: {output_file} ({os.path.getsize(output_file) / 1024:.1f} KB)")
+            else:
+                raise Exception(f"Output file was not created or is empty: {output_file}")
         
     except subprocess.TimeoutExpired:
-        print(f"    Error: Clip creation timed out")
+        log("    Error: Clip creation timed out")
         raise
     except Exception as e:
-        print(f"    Error cutting clip: {str(e)}")
+        log(f"    Error cutting clips: {str(e)}")
         raise
 
 
+def cut_clips(input_video: str, clips: List[Tuple[float, float, str]],
+              reencode: bool = REENCODE_CLIPS) -> None:
+    """
+    Cut several clips from one video with a single ffmpeg process.
+    
+    Args:
+        input_video (str): Path to the input video file
+        clips (List[Tuple[float, float, str]]): (start_time, duration, output_file) per clip
+        reencode (bool): Re-encode the video for frame-exact cuts instead of stream copying
+    
+    Raises:
+        Exception: If ffmpeg fails or any output is missing
+    """
+    for output_dir in {os.path.dirname(output_file) for _, _, output_file in clips}:
+        os.makedirs(output_dir, exist_ok=True)
+    
+    finish_cut_clips(start_cut_clips(input_video, clips, reencode), clips)
+
+
 def parse_input_csv(csv_path: str) -> List[List[Tuple[str, List[float]]]]:
     """
     Parse the input CSV file.
@@ -108,43 +281,14 @@ def parse_input_csv(csv_path: str) -> List[List[Tuple[str, List[float]]]]:
     """
     rows = []
     
-    def convert_timestamp(ts_str: str) -> float:
-        """Convert MM.SS format to total seconds."""
-        parts = ts_str.split('.')
-        if len(parts) == 2:
-            minutes = int(parts[0])
-            seconds = int(parts[1])
-            return minutes * 60 + seconds
-        else:
-            return float(ts_str)
-    
-    def clean_youtube_url(url: str) -> str:
-        """Extract just the video ID from YouTube URL, removing playlist/list parameters."""
-        try:
-            parsed = urlparse(url)
-            params = parse_qs(parsed.query)
-            
-            # Get video ID
-            video_id = None
-            if 'v' in params:
-                video_id = params['v'][0]
-            elif 'watch' in parsed.path:
-                # Fallback to return original if we can't parse it
-                return url
-            
-            if video_id:
-                # Return URL with only video ID (no playlist, no start_radio, etc.)
-                return f"https://www.youtube.com/watch?v={video_id}"
-        except:
-            pass
-        
-        return url
-    
-    with open(csv_path, 'r') as f:
+    with open(csv_path, 'r', newline='') as f:
         reader = csv.reader(f)
-        for row in reader:
+        for raw_row in reader:
+            # Strip every cell once up front
+            row = [cell.strip() for cell in raw_row]
+            
             # Skip empty rows
-            if not any(row) or all(cell.strip() == '' for cell in row):
+            if not any(row):
                 rows.append([])
                 continue
             
@@ -152,18 +296,15 @@ def parse_input_csv(csv_path: str) -> List[List[Tuple[str, List[float]]]]:
             url_timestamp_pairs = []
             for i in range(0, len(row), 2):
                 if i + 1 < len(row):
-                    url = row[i].strip()
-                    timestamps_str = row[i + 1].strip()
+                    url = row[i]
+                    timestamps_str = row[i + 1]
                     
                     if url:  # Only process if URL is not empty
                         # Clean the URL to remove playlist parameters
                         url = clean_youtube_url(url)
                         
                         # Parse timestamps (remove trailing semicolon if present)
-                        timestamps = []
-                        if timestamps_str:
-                            ts_list = [t.strip() for t in timestamps_str.split(';') if t.strip()]
-                            timestamps = [convert_timestamp(t) for t in ts_list]
+                        timestamps = convert_timestamps(timestamps_str) if timestamps_str else []
                         
                         url_timestamp_pairs.append((url, timestamps))
             
@@ -172,7 +313,127 @@ def parse_input_csv(csv_path: str) -> List[List[Tuple[str, List[float]]]]:
     return rows
 
 
-def process_clips(csv_path: str, output_base_dir: str, temp_dir: str) -> None:
+def _cut_video_clips(video_path: str, timestamps: List[float], row_idx: int, first_clip: int,
+                     row_output_dir: str, keep_video: bool, stop_event: threading.Event,
+                     reencode: bool) -> None:
+    """
+    Cut all timestamps from a downloaded video, then delete the video unless it is cached.
+    
+    Args:
+        video_path (str): Path to the downloaded video file
+        timestamps (List[float]): Clip start times in seconds
+        row_idx (int): CSV row the URL belongs to
+        first_clip (int): Clip number assigned to the first timestamp
+        row_output_dir (str): Output directory for this row (created by process_clips)
+        keep_video (bool): True if the video lives in the cache and must not be deleted
+        stop_event (threading.Event): Set when processing should stop early
+        reencode (bool): Re-encode the video for frame-exact cuts instead of stream copying
+    """
+    _cut_in_batches(video_path, timestamps, row_idx, first_clip, row_output_dir, stop_event, reencode)
+    
+    if keep_video:
+        return
+    
+    # Delete the video after all clips are cut
+    try:
+        os.remove(video_path)
+        log(f"  Deleted video: {video_path}")
+    except Exception as e:
+        log(f"  Warning: Could not delete video file: {str(e)}")
+
+
+def _cut_in_batches(video_path: str, timestamps: List[float], row_idx: int, first_clip: int,
+                    row_output_dir: str, stop_event: threading.Event, reencode: bool) -> None:
+    """Cut clips with one input-seeking ffmpeg process per batch of CUT_BATCH_SIZE."""
+    def batch_clips(batch_start: int) -> List[Tuple[float, float, str]]:
+        return [
+            (timestamp, 5.0, os.path.join(row_output_dir, f"{row_idx}.{first_clip + clip_idx}.mp4"))
+            for clip_idx, timestamp in enumerate(timestamps[batch_start:batch_start + CUT_BATCH_SIZE], start=batch_start)
+        ]
+    
+    # Cut clips in batches, one ffmpeg process per batch
+    next_batch = batch_clips(0)
+    for batch_start in range(0, len(timestamps), CUT_BATCH_SIZE):
+        if stop_event.is_set():
+            break
+        
+        batch = next_batch
+        try:
+            proc = start_cut_clips(video_path, batch, reencode)
+        except Exception as e:
+            log(f"    Error starting ffmpeg: {str(e)}")
+            proc = None
+        
+        # Build the next batch while ffmpeg works on this one
+        next_batch = batch_clips(batch_start + CUT_BATCH_SIZE)
+        
+        if proc is not None:
+            try:
+                finish_cut_clips(proc, batch)
+                continue
+            except Exception:
+                pass
+        log("    Batch cut failed, retrying clips one by one")
+        
+        # Retry individually so one bad timestamp doesn't lose the whole batch
+        for timestamp, duration, output_clip in batch:
+            if stop_event.is_set():
+                break
+            try:
+                cut_clip_fast(video_path, timestamp, duration=duration, output_file=output_clip, reencode=reencode)
+            except Exception:
+                log(f"    Failed to create clip at {timestamp}s")
+
+
+def _download_producer(jobs: list, download_queue: queue.Queue, num_workers: int,
+                       use_cache: bool, stop_event: threading.Event) -> None:
+    """
+    Download each job's video (or take it from the cache) and hand it to the cut workers.
+    
+    Pushes one None per worker when done so every worker exits.
+    """
+    try:
+        for url, timestamps, row_idx, first_clip, row_output_dir, temp_dir in jobs:
+            if stop_event.is_set():
+                break
+            
+            log(f"  Row {row_idx}: Processing URL: {url} with {len(timestamps)} timestamps")
+            
+            video_id = youtube_video_id(url) if use_cache else None
+            cache_dir = os.path.join(temp_dir, 'cache')
+            
+            video_path = find_cached_video(cache_dir, video_id) if video_id else None
+            if video_path:
+                log(f"  Using cached video: {video_path}")
+            else:
+                # Download into the cache, or name the temp file per job so
+                # rows sharing a URL don't collide
+                try:
+                    if video_id:
+                        video_path = download_youtube_video(url, cache_dir, name=video_id)
+                    else:
+                        video_path = download_youtube_video(url, temp_dir, name=f"{row_idx}.{first_clip}")
+                except Exception:
+                    log("  Skipping this URL due to download error")
+                    continue
+            
+            download_queue.put((video_path, timestamps, row_idx, first_clip, row_output_dir, bool(video_id)))
+    finally:
+        for _ in range(num_workers):
+            download_queue.put(None)
+
+
+def _cut_worker(download_queue: queue.Queue, stop_event: threading.Event, reencode: bool) -> None:
+    """Cut clips from downloaded videos until a None sentinel arrives."""
+    while True:
+        item = download_queue.get()
+        if item is None:
+            return
+        _cut_video_clips(*item, stop_event, reencode)
+
+
+def process_clips(csv_path: str, output_base_dir: str, temp_dir: str, max_workers: int = None,
+                  use_cache: bool = True, reencode: bool = REENCODE_CLIPS) -> None:
     """
     Process all videos and clips from the input CSV.
     
@@ -180,71 +441,85 @@ def process_clips(csv_path: str, output_base_dir: str, temp_dir: str) -> None:
         csv_path (str): Path to the input CSV file
         output_base_dir (str): Base output directory for clips
         temp_dir (str): Temporary directory for downloaded videos
+        max_workers (int): Number of ffmpeg cut workers (defaults to the CPU count)
+        use_cache (bool): Keep downloaded videos in temp_dir/cache for later runs
+        reencode (bool): Re-encode clips for frame-exact cuts instead of stream copying
     """
     # Parse input CSV
     rows = parse_input_csv(csv_path)
     
     print(f"Processing {len(rows)} rows from {csv_path}\n")
     
-    # Print all detected URLs for verification
-    all_urls = []
-    for row_idx, url_timestamp_pairs in enumerate(rows):
-        for url, timestamps in url_timestamp_pairs:
-            all_urls.append(url)
+    # Print all detected URLs for verification (deduplicated, in CSV order)
+    unique_urls = list(dict.fromkeys(url for pairs in rows for url, _ in pairs))
     
-    print(f"Total unique URLs to process: {len(set(all_urls))}")
+    print(f"Total unique URLs to process: {len(unique_urls)}")
     print("URLs detected from CSV:")
-    for i, url in enumerate(set(all_urls), 1):
+    for i, url in enumerate(unique_urls, 1):
         print(f"  {i}. {url}\n")
     
+    # Build one job per URL, pre-assigning clip numbers so output names
+    # stay deterministic regardless of completion order
+    jobs = []
     for row_idx, url_timestamp_pairs in enumerate(rows):
         if not url_timestamp_pairs:
             print(f"Row {row_idx}: Skipped (empty)")
             continue
         
-        print(f"Row {row_idx}:")
+        # Create output directory for this row
+        row_output_dir = os.path.join(output_base_dir, str(row_idx))
+        os.makedirs(row_output_dir, exist_ok=True)
         
         clip_count = 1
         
         for url, timestamps in url_timestamp_pairs:
             if not url or not timestamps:
-                print(f"  Skipped URL-timestamp pair (missing data)")
-                continue
-            
-            print(f"  Processing URL: {url} with {len(timestamps)} timestamps")
-            
-            # Download video
-            try:
-                video_path = download_youtube_video(url, temp_dir)
-            except Exception as e:
-                print(f"  Skipping this URL due to download error")
+                print(f"Row {row_idx}: Skipped URL-timestamp pair (missing data)")
                 continue
             
-            # Create output directory for this row
-            row_output_dir = os.path.join(output_base_dir, str(row_idx))
-            os.makedirs(row_output_dir, exist_ok=True)
-            
-            # Cut clips for each timestamp
-            for timestamp in timestamps:
-                output_clip = os.path.join(row_output_dir, f"{row_idx}.{clip_count}.mp4")
-                
-                try:
-                    cut_clip(video_path, timestamp, duration=5.0, output_file=output_clip)
-                    clip_count += 1
-                except Exception as e:
-                    print(f"    Failed to create clip at {timestamp}s")
-            
-            # Delete the video after all clips are cut
+            jobs.append((url, timestamps, row_idx, clip_count, row_output_dir, temp_dir))
+            clip_count += len(timestamps)
+    
+    # Pipeline: one thread downloads (network-bound) while a pool of workers
+    # cuts already-downloaded videos, hiding download latency behind cutting
+    num_workers = max(1, max_workers or os.cpu_count() or 1)
+    download_queue = queue.Queue(maxsize=DOWNLOAD_QUEUE_SIZE)
+    stop_event = threading.Event()
+    
+    producer = threading.Thread(
+        target=_download_producer,
+        args=(jobs, download_queue, num_workers, use_cache, stop_event),
+        daemon=True,
+    )
+    producer.start()
+    
+    cut_pool = ThreadPoolExecutor(max_workers=num_workers)
+    try:
+        futures = [cut_pool.submit(_cut_worker, download_queue, stop_event, reencode) for _ in range(num_workers)]
+        for future in as_completed(futures):
             try:
-                os.remove(video_path)
-                print(f"  Deleted video: {video_path}")
+                future.result()
             except Exception as e:
-                print(f"  Warning: Could not delete video file: {str(e)}")
-        
-        print(f"Row {row_idx}: Completed\n")
+                log(f"  Error cutting clips: {str(e)}")
+        producer.join()
+    except KeyboardInterrupt:
+        # Workers keep draining the queue (skipping cuts) so the producer
+        # can always deliver its sentinels
+        stop_event.set()
+        raise
+    finally:
+        cut_pool.shutdown()
+    
+    if use_cache:
+        evict_video_cache(os.path.join(temp_dir, 'cache'))
 
 
 def main():
+    parser = argparse.ArgumentParser(description="Download videos from the input CSV and cut 5-second clips")
+    parser.add_argument("--reencode", action="store_true", default=REENCODE_CLIPS,
+                        help="Re-encode clips for frame-exact cuts (NVENC when available, else libx264)")
+    args = parser.parse_args()
+    
     # Set up paths relative to script location
     script_dir = Path(__file__).parent
     project_root = script_dir.parent
@@ -271,7 +546,7 @@ def main():
     print("=" * 60 + "\n")
     
     try:
-        process_clips(csv_path, output_dir, temp_dir)
+        process_clips(csv_path, output_dir, temp_dir, reencode=args.reencode)
         print("\n" + "=" * 60)
         print("Processing completed successfully!")
         print("=" * 60)
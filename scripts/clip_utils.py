@@ -0,0 +1,168 @@
+"""Helpers shared by clip_processor.py and online_clip_processor.py."""
+
+import os
+import re
+import threading
+import time
+from functools import lru_cache
+from typing import List, Optional, Tuple, Union
+from urllib.parse import urlparse, parse_qs
+
+import yt_dlp
+
+
+CACHE_MAX_BYTES = 20 * 1024 ** 3  # source video cache cap, least recently used evicted first
+CACHE_EXTS = (".mp4", ".mkv", ".webm")
+
+# MM.SS, or H.MM.SS, or plain seconds
+_TS_RE = re.compile(r"^(\d+)(?:\.(\d+))?(?:\.(\d+))?$")
+
+# youtube.com/watch?...v=<id> or youtu.be/<id>; anything else goes through urlparse
+_YT_RE = re.compile(r"(?:youtube\.com/watch\?(?:[^#]*?&)?v=|youtu\.be/)([A-Za-z0-9_-]{11})(?![A-Za-z0-9_-])")
+
+_print_lock = threading.Lock()
+
+
+def log(*args, flush: bool = True, **kwargs) -> None:
+    """
+    Print under a lock so lines from parallel workers don't interleave.
+
+    Pass flush=False for high-volume lines that can wait for the next flush.
+    """
+    with _print_lock:
+        print(*args, flush=flush, **kwargs)
+
+
+class RateLimitBackoff:
+    """
+    Delay shared by all workers: zero while YouTube is happy, doubled on
+    every HTTP 429 (up to a cap) and halved again on each success.
+    """
+
+    def __init__(self, initial: float = 5.0, cap: float = 60.0):
+        self.initial = initial
+        self.cap = cap
+        self.delay = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self) -> None:
+        with self._lock:
+            delay = self.delay
+        if delay:
+            time.sleep(delay)
+
+    def throttled(self) -> float:
+        with self._lock:
+            self.delay = min(max(self.delay * 2, self.initial), self.cap)
+            return self.delay
+
+    def succeeded(self) -> None:
+        with self._lock:
+            self.delay = self.delay * 0.5 if self.delay >= 1 else 0.0
+
+
+def is_rate_limited(error: Union[str, Exception]) -> bool:
+    """Return True if a yt-dlp error (or its message) reports YouTube throttling."""
+    message = str(error)
+    return "HTTP Error 429" in message or "Too Many Requests" in message
+
+
+def convert_timestamp(ts: str) -> float:
+    """Convert MM.SS (or H.MM.SS) format to total seconds."""
+    m = _TS_RE.match(ts)
+    if not m:
+        return float(ts)
+    first, second, third = m.groups()
+    if second is None:
+        return int(first)
+    if third is None:
+        return int(first) * 60 + int(second)
+    return int(first) * 3600 + int(second) * 60 + int(third)
+
+
+def convert_timestamps(ts_raw: str) -> List[float]:
+    """Convert a semicolon-separated cell of timestamps to seconds, stripping each part once."""
+    return [convert_timestamp(t) for t in map(str.strip, ts_raw.split(";")) if t]
+
+
+@lru_cache(maxsize=4096)
+def clean_youtube_url(url: str) -> str:
+    """Extract just the video ID from YouTube URL, removing playlist/list parameters."""
+    # Fast path: the usual watch / short link with an 11-character ID
+    m = _YT_RE.search(url)
+    if m:
+        return f"https://www.youtube.com/watch?v={m.group(1)}"
+    if "v=" not in url:
+        return url
+
+    try:
+        params = parse_qs(urlparse(url).query)
+    except ValueError:
+        # Only malformed netlocs (e.g. an unclosed "[") make urlparse raise
+        return url
+
+    # Return URL with only video ID (no playlist, no start_radio, etc.)
+    if "v" in params:
+        return f"https://www.youtube.com/watch?v={params['v'][0]}"
+    return url
+
+
+def youtube_video_id(url: str) -> Optional[str]:
+    """Return the v= video ID of a YouTube watch URL, or None."""
+    params = parse_qs(urlparse(url).query)
+    if "v" in params:
+        return params["v"][0]
+    return None
+
+
+@lru_cache(maxsize=None)
+def _youtube_extractors() -> Tuple[type, ...]:
+    """Return yt-dlp's YouTube extractor classes, scanned once per process."""
+    return tuple(ie for ie in yt_dlp.extractor.gen_extractor_classes() if ie.ie_key().startswith("Youtube"))
+
+
+def youtube_ydl(opts: dict) -> yt_dlp.YoutubeDL:
+    """
+    Create a YoutubeDL with only the YouTube extractors registered.
+
+    clean_youtube_url guarantees YouTube URLs, so URL matching doesn't
+    have to scan every extractor yt-dlp ships.
+    """
+    ydl = yt_dlp.YoutubeDL(opts, auto_init=False)
+    for ie in _youtube_extractors():
+        ydl.add_info_extractor(ie)
+    return ydl
+
+
+def find_cached_video(cache_dir: str, video_id: str) -> Optional[str]:
+    """Return the cached source video (<cache_dir>/<video_id>.<ext>), or None on a miss."""
+    for ext in CACHE_EXTS:
+        path = os.path.join(cache_dir, f"{video_id}{ext}")
+        if os.path.exists(path) and os.path.getsize(path) > 0:
+            # Bump mtime so eviction treats it as recently used
+            os.utime(path)
+            return path
+    return None
+
+
+def evict_video_cache(cache_dir: str, max_bytes: int = CACHE_MAX_BYTES) -> None:
+    """Delete least recently used cached videos until the cache fits in max_bytes."""
+    if not os.path.isdir(cache_dir):
+        return
+
+    entries = []
+    for entry in os.scandir(cache_dir):
+        if entry.is_file() and entry.name.endswith(CACHE_EXTS):
+            st = entry.stat()
+            entries.append((st.st_mtime, st.st_size, entry.path))
+
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total <= max_bytes:
+            break
+        try:
+            os.remove(path)
+            total -= size
+            log(f"  Evicted cached video: {path}")
+        except OSError as e:
+            log(f"  Warning: Could not evict cached video: {str(e)}")
@@ -1,14 +1,34 @@
 import sys
+import asyncio
 import threading
 import subprocess
 import os
+import io
+import codecs
+import locale
 import shutil
+import tempfile
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 import webbrowser
 
 ROOT = Path(__file__).parent.parent
+LOG_FLUSH_MS = 33  # how often buffered log text is written to the widget (~30 Hz)
+MAX_LOG_LINES = 2000  # older lines are dropped so inserts stay cheap on long runs
+READ_CHUNK = 8192  # bytes read from the child's stdout per syscall
+PROGRESS_POLL_MS = 100  # how often the processor's progress file is checked
+
+# On Windows, children get no console window (the GUI has no console to share)
+if sys.platform == "win32":
+    _startupinfo = subprocess.STARTUPINFO()
+    _startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
+    _startupinfo.wShowWindow = subprocess.SW_HIDE
+    NO_WINDOW = {"creationflags": subprocess.CREATE_NO_WINDOW, "startupinfo": _startupinfo}
+else:
+    NO_WINDOW = {}
 
 
 class App(tk.Tk):
@@ -20,10 +40,33 @@ class App(tk.Tk):
         self.csv_path = tk.StringVar(value=str(ROOT / "input" / "input.csv"))
         self.output_path = tk.StringVar(value=str(ROOT / "output"))
 
+        # self.proc is set on the asyncio loop and read from Tk, so it's locked
         self.proc = None
-        self.proc_thread = None
+        self.proc_future = None
+        self._proc_lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._ffmpeg_path = None
+
+        # Blocking side jobs (the winget install) run here, one at a time
+        self._pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="installer")
+
+        # Progress file written by the processor, tailed by _poll_progress
+        self._progress_path = None
+        self._progress_fd = None
+        self._progress_tail = b""
+
+        # Child processes are pumped by one asyncio loop on a background thread
+        self._loop = asyncio.new_event_loop()
+        threading.Thread(target=self._loop.run_forever, daemon=True).start()
+
+        # Log lines from worker threads; drained by _flush_log on the Tk thread
+        self._log_buf = deque()
+        self._log_lock = threading.Lock()
 
         self._build_ui()
+        self.after(LOG_FLUSH_MS, self._flush_log)
+        self.after(PROGRESS_POLL_MS, self._poll_progress)
+        self.protocol("WM_DELETE_WINDOW", self.on_close)
 
     def _build_ui(self):
         frm = ttk.Frame(self, padding=8)
@@ -53,11 +96,14 @@ class App(tk.Tk):
         self.stop_btn = ttk.Button(ctrl_row, text="Stop", command=self.stop, state=tk.DISABLED)
         self.stop_btn.pack(side=tk.LEFT, padx=8)
         ttk.Button(ctrl_row, text="Open output", command=self.open_output).pack(side=tk.LEFT)
+        self.progress = ttk.Progressbar(ctrl_row, mode="determinate")
+        self.progress.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(8, 0))
 
         # Log area
         log_row = ttk.Frame(frm)
         log_row.pack(fill=tk.BOTH, expand=True, pady=6)
-        self.log = tk.Text(log_row, state=tk.NORMAL, wrap=tk.NONE)
+        # Append-only log: no undo stack growing with every insert
+        self.log = tk.Text(log_row, state=tk.NORMAL, wrap=tk.NONE, undo=False, autoseparators=False, maxundo=0)
         self.log.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         scrollbar = ttk.Scrollbar(log_row, orient=tk.VERTICAL, command=self.log.yview)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
@@ -89,23 +135,35 @@ class App(tk.Tk):
         if not path.exists():
             messagebox.showwarning("Not found", "Output folder does not exist yet")
             return
-        # Open in file explorer
-        subprocess.run(["explorer", str(path)])
+        # Open in file explorer; os.startfile goes straight to ShellExecute
+        if sys.platform == "win32":
+            os.startfile(str(path))
+        else:
+            subprocess.Popen(["xdg-open", str(path)], start_new_session=True)
 
     def _find_ffmpeg_exe(self):
-        # Search common installation locations and fallback to which()
-        # Returns Path or None
-        # 1) WinGet packages
-        local_winget = Path(os.environ.get('LOCALAPPDATA', '')) / 'Microsoft' / 'WinGet' / 'Packages'
-        candidates = [local_winget, Path(os.environ.get('LOCALAPPDATA', '')) / 'Programs' / 'Gyan', Path('C:/Program Files/Gyan')]
-        for base in candidates:
-            if base.exists():
-                for p in base.rglob('ffmpeg.exe'):
-                    return p
-        # fallback to PATH lookup
+        # Check PATH first, then the known install layouts with depth-bounded
+        # globs (no recursive walk). Returns Path or None; a hit is cached.
+        if self._ffmpeg_path:
+            return self._ffmpeg_path
+
         path = shutil.which('ffmpeg')
         if path:
-            return Path(path)
+            self._ffmpeg_path = Path(path)
+            return self._ffmpeg_path
+
+        local_appdata = Path(os.environ.get('LOCALAPPDATA', ''))
+        candidates = [
+            # WinGet: Packages/Gyan.FFmpeg_<source>/ffmpeg-<version>-full_build/bin/ffmpeg.exe
+            (local_appdata / 'Microsoft' / 'WinGet' / 'Packages', 'Gyan.FFmpeg_*/ffmpeg-*/bin/ffmpeg.exe'),
+            (local_appdata / 'Programs' / 'Gyan', '*/bin/ffmpeg.exe'),
+            (Path('C:/Program Files/Gyan'), '*/bin/ffmpeg.exe'),
+        ]
+        for base, pattern in candidates:
+            if base.exists():
+                for p in base.glob(pattern):
+                    self._ffmpeg_path = p
+                    return p
         return None
 
     def _install_ffmpeg(self):
@@ -117,7 +175,7 @@ class App(tk.Tk):
         self._append_log("Installing ffmpeg via winget... (may take a few minutes)\n")
         proc = subprocess.run([
             "winget", "install", "--id", "Gyan.FFmpeg", "-e", "--accept-package-agreements", "--accept-source-agreements"
-        ], capture_output=True, text=True)
+        ], capture_output=True, text=True, **NO_WINDOW)
 
         if proc.stdout:
             self._append_log(proc.stdout + "\n")
@@ -145,33 +203,101 @@ class App(tk.Tk):
             self.after(0, lambda: self.start_btn.config(state=tk.NORMAL))
 
     def _append_log(self, text: str):
-        def append():
+        # Workers only touch the buffer, never Tk directly
+        with self._log_lock:
+            self._log_buf.append(text)
+
+    def _flush_log(self):
+        # Write everything buffered since the last tick in a single insert
+        with self._log_lock:
+            text = "".join(self._log_buf)
+            self._log_buf.clear()
+        if text:
             self.log.insert(tk.END, text)
+            line_count = int(self.log.index("end-1c").split(".")[0])
+            if line_count > MAX_LOG_LINES:
+                self.log.delete("1.0", f"{line_count - MAX_LOG_LINES + 1}.0")
             self.log.see(tk.END)
-        self.log.after(0, append)
+        self.after(LOG_FLUSH_MS, self._flush_log)
 
-    def _run_proc(self, cmd):
+    def _read_progress(self):
+        # One read from where the last one stopped; only the newest
+        # well-formed "done/total" line matters, malformed ones are skipped
+        if self._progress_fd is None:
+            return
+        data = self._progress_tail + os.read(self._progress_fd, READ_CHUNK)
+        *lines, self._progress_tail = data.split(b"\n")
+        for line in reversed(lines):
+            try:
+                done, total = map(int, line.split(b"/"))
+            except ValueError:
+                continue
+            self.progress.config(maximum=total, value=done)
+            break
+
+    def _poll_progress(self):
+        self._read_progress()
+        self.after(PROGRESS_POLL_MS, self._poll_progress)
+
+    def _close_progress(self):
+        if self._progress_fd is None:
+            return
+        os.close(self._progress_fd)
+        self._progress_fd = None
+        try:
+            os.remove(self._progress_path)
+        except OSError:
+            pass
+
+    def _set_idle(self):
+        self._read_progress()
+        self._close_progress()
+        self.start_btn.config(state=tk.NORMAL)
+        self.stop_btn.config(state=tk.DISABLED)
+
+    async def _run_proc_async(self, cmd):
+        # Runs on self._loop; Tk is only touched via self.after
         try:
-            self.proc = subprocess.Popen(
-                cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
-                text=True,
-                bufsize=1,
-                universal_newlines=True,
+            proc = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.STDOUT,
+                **NO_WINDOW,
             )
-
-            for line in self.proc.stdout:
-                self._append_log(line)
-
-            self.proc.wait()
-            self._append_log(f"\nProcess exited with {self.proc.returncode}\n")
+            with self._proc_lock:
+                self.proc = proc
+
+            # Read in large chunks rather than per line; _flush_log batches
+            # the widget updates. The decoder handles multi-byte characters
+            # and \r\n pairs split across chunk boundaries.
+            decoder = io.IncrementalNewlineDecoder(
+                codecs.getincrementaldecoder(locale.getpreferredencoding(False))(errors="replace"),
+                translate=True,
+            )
+            # Stop reading once stop() asks, even if a grandchild holds the pipe open
+            while not self._stop_event.is_set():
+                chunk = await proc.stdout.read(READ_CHUNK)
+                if not chunk:
+                    break
+                self._append_log(decoder.decode(chunk))
+            self._append_log(decoder.decode(b"", final=True))
+
+            await proc.wait()
+            self._append_log(f"\nProcess exited with {proc.returncode}\n")
         except Exception as e:
             self._append_log(f"\nError running process: {e}\n")
         finally:
-            self.proc = None
-            self.start_btn.config(state=tk.NORMAL)
-            self.stop_btn.config(state=tk.DISABLED)
+            with self._proc_lock:
+                self.proc = None
+            self.after(0, self._set_idle)
+
+    def _terminate_proc(self, proc):
+        # Called on self._loop, which owns the process's transport
+        try:
+            proc.terminate()
+            self._append_log("\nTermination requested.\n")
+        except Exception as e:
+            self._append_log(f"\nError terminating process: {e}\n")
 
     def start(self):
         csv_path = self.csv_path.get()
@@ -186,7 +312,7 @@ class App(tk.Tk):
             if messagebox.askyesno("ffmpeg not found", "ffmpeg not found on PATH. Install via winget now?"):
                 # Run installer in background and start after install
                 self._append_log("User agreed to install ffmpeg. Installing...\n")
-                threading.Thread(target=self._install_ffmpeg_and_start, args=(csv_path, output_path), daemon=True).start()
+                self._pool.submit(self._install_ffmpeg_and_start, csv_path, output_path)
                 return
             else:
                 messagebox.showerror("ffmpeg required", "ffmpeg is required to download partial clips. Aborting.")
@@ -199,8 +325,17 @@ class App(tk.Tk):
         else:
             python_exe = sys.executable
 
+        # The processor reports per-clip progress through a temp file
+        self._close_progress()
+        fd, self._progress_path = tempfile.mkstemp(prefix="5sec-", suffix=".progress")
+        os.close(fd)
+        self._progress_fd = os.open(self._progress_path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+        self._progress_tail = b""
+        self.progress.config(value=0)
+
         script = ROOT / "scripts" / "online_clip_processor.py"
-        cmd = [python_exe, str(script), "--csv", csv_path, "--output", output_path]
+        cmd = [python_exe, str(script), "--csv", csv_path, "--output", output_path,
+               "--progress-file", self._progress_path]
 
         # UI state
         self.start_btn.config(state=tk.DISABLED)
@@ -208,19 +343,30 @@ class App(tk.Tk):
         self.log.delete(1.0, tk.END)
         self._append_log(f"Starting: {' '.join(cmd)}\n\n")
 
-        # Start background thread
-        self.proc_thread = threading.Thread(target=self._run_proc, args=(cmd,), daemon=True)
-        self.proc_thread.start()
+        # Hand the process to the background loop
+        self._stop_event.clear()
+        self.proc_future = asyncio.run_coroutine_threadsafe(self._run_proc_async(cmd), self._loop)
 
     def stop(self):
-        if self.proc and self.proc.poll() is None:
-            try:
-                self.proc.terminate()
-                self._append_log("\nTermination requested.\n")
-            except Exception as e:
-                self._append_log(f"\nError terminating process: {e}\n")
-        else:
-            self._append_log("\nNo running process.\n")
+        with self._proc_lock:
+            proc = self.proc
+            if proc and proc.returncode is None:
+                self._stop_event.set()
+                self._loop.call_soon_threadsafe(self._terminate_proc, proc)
+                return
+        self._append_log("\nNo running process.\n")
+
+    def on_close(self):
+        # Terminate any running processor before the loop it runs on stops;
+        # callbacks run in order, so the terminate goes first
+        with self._proc_lock:
+            proc = self.proc
+            if proc and proc.returncode is None:
+                self._stop_event.set()
+                self._loop.call_soon_threadsafe(self._terminate_proc, proc)
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._pool.shutdown(wait=False, cancel_futures=True)
+        self.destroy()
 
 
 def main():
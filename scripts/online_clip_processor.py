@@ -1,15 +1,311 @@
 import os
 import csv
 import subprocess
-import sys
 import argparse
 import shutil
+import sqlite3
+import sys
+import tempfile
+import itertools
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import List, Tuple
+from typing import Dict, List, Optional, Tuple
 from urllib.parse import urlparse, parse_qs
 
+import yt_dlp
+from yt_dlp.utils import DownloadError, download_range_func
+
+from clip_utils import (
+    RateLimitBackoff,
+    clean_youtube_url,
+    convert_timestamps,
+    evict_video_cache,
+    find_cached_video,
+    is_rate_limited,
+    log,
+    youtube_video_id,
+    youtube_ydl,
+)
+
+ROOT = Path(__file__).parent.parent
 
 CLIP_DURATION = 5.0  # seconds
+MAX_WORKERS = 3  # parallel URLs; kept low to avoid YouTube's per-IP throttling
+CLIP_WORKERS = os.cpu_count() or 4  # parallel clip cuts/downloads shared by all URLs
+MAX_RETRIES = 4  # retries of a yt-dlp call after HTTP 429
+CONCURRENT_FRAGMENTS = 4  # DASH/HLS fragments per download; several downloads run at once
+# Single-file (audio+video) mp4, so yt-dlp has nothing to merge
+PROGRESSIVE_FORMAT = "best[height<=1080][ext=mp4]/best[ext=mp4]/best"
+# Up to 1080p avc1 video plus mp4a audio, both mp4-compatible for stream copy
+SOURCE_FORMAT = "bv*[vcodec^=avc1][height<=1080]+ba[acodec^=mp4a]/b"
+SOCKET_TIMEOUT = 10  # seconds before a stalled connection is abandoned
+HTTP_CHUNK_SIZE = 10 * 1024 ** 2  # large ranged GETs over one kept-alive connection
+URL_EXPIRY_MARGIN = 60  # seconds; re-resolve signed media URLs this long before they expire
+# Persists yt-dlp's player/signature cache across runs
+YDL_CACHE_DIR = ROOT / ".cache" / "yt-dlp"
+# Finished clips by (video ID, start, duration), so re-runs skip them
+CLIP_INDEX_PATH = ROOT / ".cache" / "clips.sqlite"
+# Where section downloads keep their .part files until done; follows
+# TMPDIR/TEMP, so pointing that at a RAM disk keeps this I/O off the drive
+YDL_TEMP_DIR = tempfile.gettempdir()
+
+# Run from the GUI there is no console, and Windows would open one per ffmpeg call
+if sys.platform == "win32":
+    _startupinfo = subprocess.STARTUPINFO()
+    _startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
+    _startupinfo.wShowWindow = subprocess.SW_HIDE
+    NO_WINDOW = {"creationflags": subprocess.CREATE_NO_WINDOW, "startupinfo": _startupinfo}
+else:
+    NO_WINDOW = {}
+
+# ffmpeg arguments shared by every cut: quiet, stream copy and the moov atom
+# up front so clips start playing immediately. No -avoid_negative_ts: with
+# -ss before -i the edit list hides the pre-roll back to the keyframe, and
+# make_zero would shift that pre-roll into the clip
+_FFMPEG_PREFIX = ("ffmpeg", "-hide_banner", "-loglevel", "error")
+_REMUX_ARGS = ("-movflags", "+faststart")
+_COPY_ARGS = ("-c:v", "copy", "-c:a", "copy", *_REMUX_ARGS, "-y")
+
+# yt-dlp options per kind of call; one YoutubeDL per kind is kept per thread
+_YDL_OPTS = {
+    "section": {
+        # Pre-merged mp4 so yt-dlp has no separate audio/video to remux,
+        # and keyframe-based cuts so ffmpeg never re-encodes to align
+        "format": PROGRESSIVE_FORMAT,
+        "force_keyframes_at_cuts": False,
+        # yt-dlp cuts sections with ffmpeg; keep that a pure stream copy remux
+        "external_downloader_args": {
+            "ffmpeg_o": list(_REMUX_ARGS),
+        },
+    },
+    "source": {
+        "format": SOURCE_FORMAT,
+        "merge_output_format": "mp4",
+    },
+    "resolve": {
+        # Same quality as the full download; YouTube's only progressive mp4
+        # is 360p, so the stream fallback reads separate video and audio URLs
+        "format": SOURCE_FORMAT,
+    },
+}
+
+
+# YoutubeDL instances are not thread-safe, so each worker thread keeps its own
+_ydl_local = threading.local()
+
+# One lock per URL / video ID so parallel jobs never fetch the same thing twice
+_key_locks: Dict[str, threading.Lock] = {}
+_key_locks_guard = threading.Lock()
+
+# Raw (unprocessed) yt-dlp info per URL, shared by all clips of that video
+_info_cache: Dict[str, dict] = {}
+
+
+_backoff = RateLimitBackoff()
+
+
+class ClipProgress:
+    """
+    Count of finished clips shared by all workers, optionally mirrored as
+    "done/total" lines to a file that the GUI tails for its progress bar.
+    """
+
+    def __init__(self, total: int, path: Optional[str] = None):
+        self.total = total
+        self.done = 0
+        self._lock = threading.Lock()
+        self._file = open(path, "w", encoding="utf-8") if path else None
+
+    def step(self) -> int:
+        with self._lock:
+            self.done += 1
+            if self._file:
+                self._file.write(f"{self.done}/{self.total}\n")
+                self._file.flush()
+            return self.done
+
+    def close(self) -> None:
+        if self._file:
+            self._file.close()
+            self._file = None
+
+
+class ClipIndex:
+    """
+    SQLite record of finished clips keyed by (video ID, start, duration).
+
+    Re-running a CSV, or resuming after a crash, reuses every clip that is
+    recorded and still on disk instead of fetching it again. Output names
+    are positional (<row>.<n>.mp4), so another CSV can overwrite a recorded
+    file: each path belongs to one entry only, and its size and mtime must
+    still match what was recorded.
+    """
+
+    SCHEMA_VERSION = 1
+
+    def __init__(self, path: Path):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # One connection shared by the clip workers, serialised by the lock
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            (version,) = self._conn.execute("PRAGMA user_version").fetchone()
+            if version < self.SCHEMA_VERSION:
+                # Entries without size/mtime can't be validated; start over
+                self._conn.execute("DROP TABLE IF EXISTS clips")
+                self._conn.execute(f"PRAGMA user_version = {self.SCHEMA_VERSION}")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS clips("
+                "vid TEXT, start REAL, dur REAL, path TEXT, size INTEGER, mtime_ns INTEGER, "
+                "PRIMARY KEY (vid, start, dur))"
+            )
+
+    def lookup(self, vid: str, start: float, dur: float) -> Optional[str]:
+        """Return the recorded clip's path, or None if unknown, gone or since overwritten."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT path, size, mtime_ns FROM clips WHERE vid = ? AND start = ? AND dur = ?",
+                (vid, start, dur),
+            ).fetchone()
+        if not row:
+            return None
+
+        path, size, mtime_ns = row
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        if st.st_size == 0 or st.st_size != size or st.st_mtime_ns != mtime_ns:
+            return None
+        return path
+
+    def record(self, vid: str, start: float, dur: float, path: str) -> None:
+        path = os.path.abspath(path)
+        st = os.stat(path)
+        with self._lock, self._conn:
+            # Whatever was recorded at this path before has just been replaced
+            self._conn.execute("DELETE FROM clips WHERE path = ?", (path,))
+            self._conn.execute(
+                "INSERT OR REPLACE INTO clips VALUES (?, ?, ?, ?, ?, ?)",
+                (vid, start, dur, path, st.st_size, st.st_mtime_ns),
+            )
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+def _get_ydl(kind: str) -> yt_dlp.YoutubeDL:
+    """
+    Return this thread's YoutubeDL for the given kind of call.
+
+    Reusing the instance keeps yt-dlp's extractors loaded and its HTTP
+    connections open instead of starting a new interpreter per clip; only
+    the YouTube extractors are registered (see youtube_ydl).
+    """
+    instances = getattr(_ydl_local, "instances", None)
+    if instances is None:
+        instances = _ydl_local.instances = {}
+
+    if kind not in instances:
+        opts = {
+            "quiet": True,
+            "no_warnings": True,
+            "noprogress": True,
+            "concurrent_fragment_downloads": CONCURRENT_FRAGMENTS,
+            "socket_timeout": SOCKET_TIMEOUT,
+            "http_chunk_size": HTTP_CHUNK_SIZE,
+            "cachedir": str(YDL_CACHE_DIR),
+            **_YDL_OPTS[kind],
+        }
+        instances[kind] = youtube_ydl(opts)
+    return instances[kind]
+
+
+def _lock_for(key: str) -> threading.Lock:
+    """Return the lock guarding work on key, creating it on first use."""
+    with _key_locks_guard:
+        return _key_locks.setdefault(key, threading.Lock())
+
+
+def _with_backoff(fn):
+    """Call fn(), backing off and retrying only when YouTube throttles us."""
+    for attempt in range(MAX_RETRIES + 1):
+        _backoff.wait()
+        try:
+            result = fn()
+        except DownloadError as e:
+            if attempt == MAX_RETRIES or not is_rate_limited(str(e)):
+                raise
+            log(f"    Rate limited by YouTube, retrying in {_backoff.throttled():.0f}s")
+            continue
+
+        _backoff.succeeded()
+        return result
+
+
+def url_expired(media_url: str) -> bool:
+    """Return True if a signed media URL's expire= deadline has passed (or nearly has)."""
+    expire = parse_qs(urlparse(media_url).query).get("expire")
+    if not expire or not expire[0].isdigit():
+        return False
+    return int(expire[0]) <= time.time() + URL_EXPIRY_MARGIN
+
+
+def _info_expired(info: dict) -> bool:
+    """Return True if the signed format URLs in info can no longer be used."""
+    return any(url_expired(f["url"]) for f in info.get("formats") or [] if f.get("url"))
+
+
+def get_video_info(url: str) -> dict:
+    """
+    Extract url's metadata once per process and reuse it afterwards.
+
+    The info is left unprocessed so each kind of call can still apply its
+    own format selection to it. It is extracted again once its signed
+    format URLs have expired.
+    """
+    with _lock_for(url):
+        info = _info_cache.get(url)
+        if info is None or _info_expired(info):
+            ydl = _get_ydl("resolve")
+            info = _with_backoff(lambda: ydl.extract_info(url, download=False, process=False))
+            _info_cache[url] = info
+        return info
+
+
+def _private_info(info: dict) -> dict:
+    """
+    Copy the parts of info that process_ie_result fills in place.
+
+    A deepcopy would fail on post-live / live-from-start videos, whose
+    formats carry fragments as a LazyList over a generator; those values
+    are shared, only the dicts holding them are fresh.
+    """
+    private = dict(info)
+    for key in ("formats", "thumbnails"):
+        if info.get(key):
+            private[key] = [dict(item) for item in info[key]]
+    return private
+
+
+def run_yt_dlp(kind: str, url: str, download: bool, outtmpl: Optional[str] = None,
+               download_ranges=None, paths: Optional[Dict[str, str]] = None) -> dict:
+    """Select formats for url's cached info (and optionally download), with backoff."""
+    info = get_video_info(url)
+
+    ydl = _get_ydl(kind)
+    if outtmpl:
+        ydl.params["outtmpl"]["default"] = outtmpl
+    ydl.params["download_ranges"] = download_ranges
+    # yt-dlp ignores paths for an absolute outtmpl, so these only apply to relative ones
+    ydl.params["paths"] = paths or {}
+
+    return _with_backoff(lambda: ydl.process_ie_result(_private_info(info), download=download))
 
 
 def ffmpeg_available() -> bool:
@@ -17,19 +313,14 @@ def ffmpeg_available() -> bool:
     return shutil.which("ffmpeg") is not None
 
 
-def clean_youtube_url(url: str) -> str:
-    """Extract just the video ID from YouTube URL, removing playlist/list parameters."""
-    try:
-        parsed = urlparse(url)
-        params = parse_qs(parsed.query)
-        
-        if 'v' in params:
-            video_id = params['v'][0]
-            return f"https://www.youtube.com/watch?v={video_id}"
-    except:
-        pass
-    
-    return url
+def cached_source_video(url: str, cache_dir: str, video_id: str) -> str:
+    """Return the cached source video for url, downloading it on a miss."""
+    with _lock_for(video_id):
+        cached = find_cached_video(cache_dir, video_id)
+        if cached:
+            log(f"  Using cached video: {cached}")
+            return cached
+        return download_source_video(url, cache_dir, video_id)
 
 
 def download_clip(
@@ -37,139 +328,327 @@ def download_clip(
     start_time: float,
     duration: float,
     output_template: str,
-) -> None:
+) -> Optional[str]:
     """
-    Download a short clip directly from YouTube using yt-dlp --download-sections
+    Download a short clip directly from YouTube using yt-dlp download_ranges
+
+    Returns the path of the downloaded clip, if yt-dlp reports one.
     """
     start = start_time
     end = start_time + duration
-    section = f"*{int(start)}-{int(end)}"
 
-    # Use the current Python interpreter (works with activated venv or system Python)
-    python_exe = sys.executable
-    
-    cmd = [
-        python_exe,
-        "-m",
-        "yt_dlp",
-        "--download-sections",
-        section,
-        "-f",
-        "bv*[vcodec^=avc1][height<=1080]+ba[acodec^=mp4a]/b",
-        "--merge-output-format",
-        "mp4",
-        "--postprocessor-args",
-        "ffmpeg:-c:v libx264 -preset veryfast -crf 18 -pix_fmt yuv420p -c:a aac -b:a 192k",
-        "-o",
-        output_template,
-        url,
-    ]
+    try:
+        info = run_yt_dlp(
+            "section",
+            url,
+            download=True,
+            outtmpl=os.path.basename(output_template) + ".%(ext)s",
+            download_ranges=download_range_func(None, [(int(start), int(end))]),
+            # Intermediate files go to the temp dir; only the finished clip lands in the row folder
+            paths={"home": os.path.dirname(output_template), "temp": YDL_TEMP_DIR},
+        )
+    except DownloadError as e:
+        raise Exception(f"Failed to download clip: {str(e)}")
+
+    downloads = info.get("requested_downloads") or []
+    return downloads[-1].get("filepath") if downloads else None
+
+
+def resolve_stream_url(url: str) -> Tuple[str, Optional[str]]:
+    """
+    Resolve the direct media URL(s) of the selected format.
+
+    ffmpeg can then seek into them with HTTP range requests, so clips are
+    fetched without a yt-dlp run per timestamp. Returns (media URL, None)
+    for a single-file format, or (video URL, audio URL) when the selected
+    format is split.
+    """
+    try:
+        info = run_yt_dlp("resolve", url, download=False)
+    except DownloadError as e:
+        raise Exception(f"Failed to resolve stream URL: {str(e)}")
+
+    if info.get("url"):
+        return info["url"], None
+
+    requested = info.get("requested_formats") or []
+    video = next((f["url"] for f in requested if f.get("vcodec") != "none" and f.get("url")), None)
+    audio = next((f["url"] for f in requested if f.get("vcodec") == "none" and f.get("url")), None)
+    if not video:
+        raise Exception("Failed to resolve stream URL: no direct media URL")
+    return video, audio
 
-    # Run yt-dlp and capture output so errors are visible for debugging
-    print(f"    Downloading... ", end="", flush=True)
-    result = subprocess.run(cmd, capture_output=True, text=True)
 
-    if result.returncode != 0:
-        # Print captured output to help diagnose failures
-        print()
-        if result.stdout:
-            print(result.stdout)
+def download_source_video(url: str, temp_dir: str, name: str = "%(id)s") -> str:
+    """
+    Download the full source video once so every timestamp can be cut locally.
+
+    Returns the path of the merged mp4 in temp_dir.
+    """
+    os.makedirs(temp_dir, exist_ok=True)
+
+    try:
+        info = run_yt_dlp(
+            "source",
+            url,
+            download=True,
+            outtmpl=os.path.join(temp_dir, f"{name}.%(ext)s"),
+        )
+    except DownloadError as e:
+        raise Exception(f"Failed to download video: {str(e)}")
+
+    downloads = info.get("requested_downloads") or []
+    if not downloads or not downloads[-1].get("filepath"):
+        raise Exception("Failed to download video: no output file")
+    return downloads[-1]["filepath"]
+
+
+def cut_clip(
+    input_video: str,
+    start_time: float,
+    duration: float,
+    output_file: str,
+    input_audio: Optional[str] = None,
+) -> None:
+    """
+    Cut a clip with ffmpeg stream copy (no re-encode).
+
+    input_video may be a local file or a direct http(s) media URL;
+    input_audio is a separate audio URL to mux in for split formats.
+    """
+    # -ss before -i seeks by keyframe without decoding
+    start = str(start_time)
+    if input_audio:
+        # Seek the audio input the same way and take one stream from each
+        inputs = ("-ss", start, "-i", input_video, "-ss", start, "-i", input_audio, "-map", "0:v:0", "-map", "1:a:0")
+    else:
+        inputs = ("-ss", start, "-i", input_video)
+    cmd = [*_FFMPEG_PREFIX, *inputs, "-t", str(duration), *_COPY_ARGS, output_file]
+
+    result = subprocess.run(cmd, capture_output=True, text=True, timeout=120, **NO_WINDOW)
+
+    if result.returncode != 0 or not os.path.exists(output_file) or os.path.getsize(output_file) == 0:
         if result.stderr:
-            print(result.stderr)
-        raise Exception(f"Failed to download clip (exit {result.returncode})")
+            log(result.stderr[:300])
+        raise Exception(f"Failed to cut clip (exit {result.returncode})")
+
 
-    print("OK")
+def _parse_row(row: List[str]) -> List[Tuple[str, List[float]]]:
+    """Turn stripped cells URL1, TS1, URL2, TS2, ... into (URL, [seconds]) pairs."""
+    return [
+        # Clean URL to remove playlist parameters
+        (clean_youtube_url(url), convert_timestamps(ts_raw))
+        for url, ts_raw in zip(row[::2], row[1::2])
+        if url and ts_raw
+    ]
 
 
 def parse_input_csv(
     csv_path: str,
 ) -> List[List[Tuple[str, List[float]]]]:
-    rows = []
-
-    def convert_timestamp(ts: str) -> float:
-        parts = ts.split(".")
-        if len(parts) == 2:
-            return int(parts[0]) * 60 + int(parts[1])
-        return float(ts)
-
     with open(csv_path, newline="", encoding="utf-8") as f:
-        reader = csv.reader(f)
-        for row in reader:
-            if not any(row):
-                rows.append([])
-                continue
-
-            pairs = []
-            for i in range(0, len(row), 2):
-                if i + 1 >= len(row):
-                    continue
-
-                url = row[i].strip()
-                ts_raw = row[i + 1].strip()
+        # Empty rows come out as [] so row numbering is unaffected
+        return [_parse_row([cell.strip() for cell in row]) for row in csv.reader(f)]
 
-                if not url or not ts_raw:
-                    continue
 
-                # Clean URL to remove playlist parameters
-                url = clean_youtube_url(url)
+def _make_clip(
+    url: str,
+    video_path: Optional[str],
+    stream: Optional[Tuple[str, Optional[str]]],
+    ts: float,
+    output_template: str,
+) -> Optional[str]:
+    """Produce one clip from the best available source for it and return its path."""
+    if video_path:
+        cut_clip(video_path, ts, CLIP_DURATION, output_template + ".mp4")
+        return output_template + ".mp4"
+
+    if stream:
+        try:
+            # Signed URLs expire after a few hours; long runs pick up fresh ones
+            if url_expired(stream[0]):
+                stream = resolve_stream_url(url)
+            cut_clip(stream[0], ts, CLIP_DURATION, output_template + ".mp4", stream[1])
+            return output_template + ".mp4"
+        except Exception:
+            pass
+
+    return download_clip(url, ts, CLIP_DURATION, output_template)
+
+
+def _reuse_indexed_clips(
+    vid: str,
+    clips: List[Tuple[int, float, str]],
+    output_row_num: int,
+    progress: ClipProgress,
+    clip_index: ClipIndex,
+) -> List[Tuple[int, float, str]]:
+    """Reuse every clip the index already has and return the ones still to make."""
+    pending = []
+    for clip in clips:
+        clip_count, ts, output_template = clip
+        indexed = clip_index.lookup(vid, ts, CLIP_DURATION)
+        if indexed is None:
+            pending.append(clip)
+            continue
+
+        target = output_template + os.path.splitext(indexed)[1]
+        try:
+            # Same CSV and output folder: the clip is already where it belongs
+            if os.path.abspath(indexed) != os.path.abspath(target):
+                shutil.copyfile(indexed, target)
+                clip_index.record(vid, ts, CLIP_DURATION, target)
+        except OSError:
+            pending.append(clip)
+            continue
+
+        log(f"    [{progress.step()}/{progress.total}] {output_row_num}.{clip_count} {int(ts)}s cached", flush=False)
+    return pending
+
+
+def _process_one_url(
+    url: str,
+    clips: List[Tuple[int, float, str]],
+    output_row_num: int,
+    temp_dir: str,
+    progress: ClipProgress,
+    use_cache: bool,
+    clip_pool: ThreadPoolExecutor,
+    clip_index: Optional[ClipIndex],
+) -> None:
+    """
+    Fetch one source video, cut all of its clips, then delete it unless cached.
 
-                timestamps = [
-                    convert_timestamp(t.strip())
-                    for t in ts_raw.split(";")
-                    if t.strip()
-                ]
+    clips holds (clip number, timestamp, output template) for each timestamp.
+    """
+    log(f"  Row {output_row_num}: URL with {len(clips)} timestamp(s): {url}")
 
-                pairs.append((url, timestamps))
+    vid = youtube_video_id(url)
+    if clip_index and vid:
+        clips = _reuse_indexed_clips(vid, clips, output_row_num, progress, clip_index)
+        if not clips:
+            return
 
-            rows.append(pairs)
+    video_id = vid if use_cache else None
 
-    return rows
+    # Fetch the source once and cut every timestamp from it locally;
+    # if that fails, cut straight from the resolved stream URL, and only
+    # fall back to per-clip section downloads as a last resort
+    stream = None
+    try:
+        if video_id:
+            video_path = cached_source_video(url, os.path.join(temp_dir, "cache"), video_id)
+        else:
+            # Name the temp file per job so parallel rows sharing a URL don't collide
+            video_path = download_source_video(url, temp_dir, f"{output_row_num}.{clips[0][0]}")
+    except Exception as e:
+        log(f"  Row {output_row_num}: full download failed, cutting from the stream URL: {str(e)[:50]}")
+        video_path = None
+        try:
+            stream = resolve_stream_url(url)
+        except Exception as e:
+            log(f"  Row {output_row_num}: falling back to section downloads: {str(e)[:50]}")
+
+    # Clips run on the shared clip pool; names were fixed up front
+    futures = {
+        clip_pool.submit(_make_clip, url, video_path, stream, ts, output_template): (clip_count, ts)
+        for clip_count, ts, output_template in clips
+    }
+
+    for future in as_completed(futures):
+        clip_count, ts = futures[future]
+        try:
+            path = future.result()
+            if clip_index and vid and path:
+                clip_index.record(vid, ts, CLIP_DURATION, path)
+            status = "OK"
+        except Exception as e:
+            status = f"Error: {str(e)[:50]}"
+
+        # Per-clip lines stay buffered until the row's "completed" line flushes
+        log(f"    [{progress.step()}/{progress.total}] {output_row_num}.{clip_count} {int(ts)}s {status}", flush=False)
+
+    # Delete the source video after all clips are cut (cached ones are kept)
+    if video_path and not video_id:
+        try:
+            os.remove(video_path)
+        except OSError as e:
+            log(f"  Warning: Could not delete video file: {str(e)}")
 
 
 def process_clips(
     csv_path: str,
     output_base_dir: str,
+    temp_dir: str,
+    workers: int = MAX_WORKERS,
+    use_cache: bool = True,
+    clip_workers: int = CLIP_WORKERS,
+    progress_file: Optional[str] = None,
+    reuse_clips: bool = True,
 ) -> None:
     rows = parse_input_csv(csv_path)
 
     # Filter out empty rows and count only non-empty rows
     non_empty_rows = [(idx, pairs) for idx, pairs in enumerate(rows) if pairs]
     
-    print(f"Processing {len(non_empty_rows)} non-empty rows\n")
-
-    total_clips = sum(len(ts) for _, pairs in non_empty_rows for _, ts in pairs)
-    clips_done = 0
+    print(f"Processing {len(non_empty_rows)} non-empty rows\n", flush=True)
 
+    # One job per (row, URL), with every clip's number and output template
+    # (x.y without extension, yt-dlp adds it) fixed up front so parallel
+    # jobs write deterministic names
+    jobs = []
     for output_row_num, (_, pairs) in enumerate(non_empty_rows, start=1):
-        print(f"Row {output_row_num}:")
-        clip_count = 1
-
         row_out = os.path.join(output_base_dir, str(output_row_num))
-        os.makedirs(row_out, exist_ok=True)
-
+        clip_nums = itertools.count(1)
         for url, timestamps in pairs:
-            print(f"  URL with {len(timestamps)} timestamp(s)")
-
-            for ts in timestamps:
-                clips_done += 1
-                # Save as x.y without extension (yt-dlp will add it)
-                output_template = os.path.join(
-                    row_out, f"{output_row_num}.{clip_count}"
-                )
-
-                print(f"    [{clips_done}/{total_clips}] {int(ts)}s ", end="", flush=True)
-                try:
-                    download_clip(
-                        url,
-                        ts,
-                        CLIP_DURATION,
-                        output_template,
-                    )
-                    clip_count += 1
-                except Exception as e:
-                    print(f"Error: {str(e)[:50]}")
-
-        print(f"Row {output_row_num}: completed\n")
+            # timestamps goes first so zip never draws an unused clip number
+            clips = [
+                (clip_count, ts, os.path.join(row_out, f"{output_row_num}.{clip_count}"))
+                for ts, clip_count in zip(timestamps, clip_nums)
+            ]
+            if clips:
+                jobs.append((url, clips, output_row_num))
+
+    for row_out in {os.path.dirname(clips[0][2]) for _, clips, _ in jobs}:
+        Path(row_out).mkdir(parents=True, exist_ok=True)
+
+    progress = ClipProgress(sum(len(clips) for _, clips, _ in jobs), progress_file)
+    clip_index = ClipIndex(CLIP_INDEX_PATH) if reuse_clips else None
+
+    remaining = Counter(job[2] for job in jobs)
+
+    pool = ThreadPoolExecutor(max_workers=max(1, workers))
+    clip_pool = ThreadPoolExecutor(max_workers=max(1, clip_workers))
+    try:
+        futures = {
+            pool.submit(_process_one_url, *job, temp_dir, progress, use_cache, clip_pool, clip_index): job[2]
+            for job in jobs
+        }
+        for future in as_completed(futures):
+            output_row_num = futures[future]
+            try:
+                future.result()
+            except Exception as e:
+                log(f"  Row {output_row_num}: Error: {str(e)[:50]}")
+
+            remaining[output_row_num] -= 1
+            if not remaining[output_row_num]:
+                log(f"Row {output_row_num}: completed\n")
+    except KeyboardInterrupt:
+        pool.shutdown(wait=False, cancel_futures=True)
+        clip_pool.shutdown(wait=False, cancel_futures=True)
+        raise
+    finally:
+        # Workers may still be recording clips, so wait for them before
+        # closing the index and progress file they write to
+        pool.shutdown()
+        clip_pool.shutdown()
+        if clip_index:
+            clip_index.close()
+        progress.close()
+
+    if use_cache:
+        evict_video_cache(os.path.join(temp_dir, "cache"))
 
 
 def main():
@@ -178,12 +657,17 @@ def main():
     )
     parser.add_argument("--csv", "-c", type=str, help="Path to input CSV")
     parser.add_argument("--output", "-o", type=str, help="Path to output directory")
+    parser.add_argument("--temp", "-t", type=str, help="Path to temp directory for source videos")
+    parser.add_argument("--workers", "-w", type=int, default=MAX_WORKERS, help="Number of URLs to process in parallel (1 = serial)")
+    parser.add_argument("--clip-workers", type=int, default=CLIP_WORKERS, help="Number of clips to cut or download in parallel")
+    parser.add_argument("--no-cache", action="store_true", help="Delete source videos after cutting instead of caching them")
+    parser.add_argument("--no-reuse", action="store_true", help="Make every clip again even if an identical one was made before")
+    parser.add_argument("--progress-file", type=str, help="Write a done/total line per finished clip to this file")
     args = parser.parse_args()
 
-    root = Path(__file__).parent.parent
-
-    csv_path = Path(args.csv) if args.csv else root / "input" / "input.csv"
-    output_dir = Path(args.output) if args.output else root / "output"
+    csv_path = Path(args.csv) if args.csv else ROOT / "input" / "input.csv"
+    output_dir = Path(args.output) if args.output else ROOT / "output"
+    temp_dir = Path(args.temp) if args.temp else ROOT / "temp"
 
     if not csv_path.exists():
         print(f"Input CSV not found: {csv_path}")
@@ -200,6 +684,12 @@ def main():
     process_clips(
         str(csv_path),
         str(output_dir),
+        str(temp_dir),
+        args.workers,
+        not args.no_cache,
+        args.clip_workers,
+        args.progress_file,
+        not args.no_reuse,
     )
 
     print("All done.")